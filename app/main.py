@@ -1,13 +1,39 @@
+import hashlib
 import os
+import re
+from contextlib import asynccontextmanager
 from datetime import date
-from typing import Optional
+from typing import Any, Optional
 
-from fastapi import FastAPI, Query
-from fastapi.responses import HTMLResponse, JSONResponse
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+import asyncpg
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.gzip import GZipMiddleware
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from sqlalchemy import Boolean, Integer, String, bindparam, create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.pool import NullPool
 
-app = FastAPI(title="Speaking Opportunity Finder")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema setup normally runs once per deploy (see render.yaml), not in
+    # every worker; RUN_DB_INIT=1 opts a process into doing it at startup.
+    if os.getenv("RUN_DB_INIT") == "1":
+        init_db()
+    # Reads on Postgres go through asyncpg so they don't hold a worker thread.
+    app.state.read_pool = await create_read_pool() if IS_POSTGRES else None
+    try:
+        yield
+    finally:
+        if app.state.read_pool is not None:
+            await app.state.read_pool.close()
+
+app = FastAPI(title="Speaking Opportunity Finder", default_response_class=ORJSONResponse, lifespan=lifespan)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 def _normalize_database_url(url: str) -> str:
     # Render provides DATABASE_URL like postgres://... which SQLAlchemy expects as postgresql://...
@@ -15,17 +41,57 @@ def _normalize_database_url(url: str) -> str:
         return url.replace("postgres://", "postgresql://", 1)
     return url
 
-def get_engine() -> Engine:
+def _database_url() -> str:
     db_url = os.getenv("DATABASE_URL")
     if not db_url:
         # Local fallback for quick testing
         db_url = "sqlite:///./opportunities.db"
-    db_url = _normalize_database_url(db_url)
-    connect_args = {"check_same_thread": False} if db_url.startswith("sqlite") else {}
-    return create_engine(db_url, pool_pre_ping=True, connect_args=connect_args)
+    return _normalize_database_url(db_url)
+
+def get_engine() -> Engine:
+    db_url = _database_url()
+    if db_url.startswith("sqlite"):
+        return create_engine(db_url, pool_pre_ping=True, connect_args={"check_same_thread": False})
+
+    connect_args = {"application_name": "speakingopps"}
+    # An explicit ?sslmode=... in DATABASE_URL wins over the default.
+    if "sslmode" not in make_url(db_url).query:
+        connect_args["sslmode"] = "require"
+
+    # Behind PgBouncer in transaction mode the bouncer owns pooling, so keep
+    # no connections open on our side.
+    if os.getenv("PGBOUNCER") == "1":
+        return create_engine(db_url, poolclass=NullPool, connect_args=connect_args)
+
+    # On Postgres this engine only runs schema setup and the view refresh;
+    # reads go through the asyncpg pool below, so it stays small.
+    return create_engine(
+        db_url,
+        pool_size=2,
+        max_overflow=3,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args=connect_args,
+    )
+
+async def create_read_pool() -> asyncpg.Pool:
+    url = make_url(_database_url())
+    kwargs = {"min_size": 2, "max_size": 20, "server_settings": {"application_name": "speakingopps"}}
+    if "sslmode" not in url.query:
+        kwargs["ssl"] = "require"
+    # Transaction-mode PgBouncer can't keep asyncpg's prepared statements, and
+    # it does the pooling, so only hold a few short-lived connections to it.
+    if os.getenv("PGBOUNCER") == "1":
+        kwargs.update(min_size=0, max_size=5, max_inactive_connection_lifetime=30, statement_cache_size=0)
+    dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+    return await asyncpg.create_pool(dsn, **kwargs)
 
 engine = get_engine()
 
+# Read-only queries skip the BEGIN/COMMIT envelope; writes keep using engine.begin().
+read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS opportunities (
   id SERIAL PRIMARY KEY,
@@ -42,51 +108,304 @@ CREATE TABLE IF NOT EXISTS opportunities (
 );
 """
 
+# Single-row counter that scrape.py bumps in the same transaction as its
+# upserts. It changes on every write, unlike max(last_seen), and reading it is
+# a primary-key lookup.
+VERSION_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS data_version (
+  id INTEGER PRIMARY KEY CHECK (id = 1),
+  version BIGINT NOT NULL
+);
+"""
+
+SEED_VERSION_SQL = "INSERT INTO data_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING;"
+
+# On Postgres, tags are also kept as a normalized (trimmed, lowercased) array
+# derived from topic_tags, so tag search is an exact GIN lookup rather than a
+# substring match. Being a generated column, it backfills existing rows and
+# needs nothing from the scraper.
+PG_SCHEMA_SQL = r"""
+ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS topic_tags_arr TEXT[]
+  GENERATED ALWAYS AS (regexp_split_to_array(lower(btrim(topic_tags)), '\s*,\s*')) STORED;
+"""
+
+# Trigram indexes let Postgres serve the leading-wildcard ILIKE searches below
+# from an index instead of a sequential scan. The order indexes match the
+# listing's ORDER BY exactly so LIMIT can stop early instead of sorting. They
+# are deliberately not covering: INCLUDEing the free-text columns would hit the
+# ~2.7 KB B-tree tuple limit on a wide row and abort the whole scrape batch.
+PG_INDEX_SQL = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS opp_title_trgm ON opportunities USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS opp_org_trgm ON opportunities USING gin (organizer gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS opp_tags_gin ON opportunities USING gin (topic_tags_arr);
+CREATE INDEX IF NOT EXISTS opp_deadline_idx ON opportunities (cfp_deadline ASC NULLS LAST, last_seen DESC);
+CREATE INDEX IF NOT EXISTS opp_remote_deadline_idx ON opportunities (cfp_deadline ASC NULLS LAST, last_seen DESC)
+  WHERE is_remote = true;
+"""
+
+# Precomputed head of the default listing, served when no filters are set.
+# The unique index on id is required by REFRESH ... CONCURRENTLY.
+TOP_VIEW_ROWS = 500
+PG_TOP_VIEW_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS opp_top AS
+  SELECT id, title, organizer, url, location, is_remote, topic_tags, cfp_deadline, event_date, source, last_seen
+  FROM opportunities
+  ORDER BY cfp_deadline ASC NULLS LAST, last_seen DESC
+  LIMIT {TOP_VIEW_ROWS};
+CREATE UNIQUE INDEX IF NOT EXISTS opp_top_id ON opp_top (id);
+"""
+
+REFRESH_TOP_VIEW_SQL = "REFRESH MATERIALIZED VIEW CONCURRENTLY opp_top;"
+
+BUMP_VERSION_SQL = "UPDATE data_version SET version = version + 1 WHERE id = 1;"
+
+IS_POSTGRES = engine.dialect.name == "postgresql"
+
+# SQLite has no ILIKE, but its LIKE is already case-insensitive for ASCII.
+LIKE_OP = "ILIKE" if IS_POSTGRES else "LIKE"
+
+def _sqlite_tag_list(topic_tags: Optional[str]) -> Optional[str]:
+    # Same split as the Postgres topic_tags_arr column, as ",tag1,tag2,".
+    if topic_tags is None:
+        return None
+    return "," + ",".join(re.split(r"\s*,\s*", topic_tags.strip(" ").lower())) + ","
+
+# SQLite has no arrays, so it looks for ",tag," in the normalized tag list;
+# instr() treats % and _ in the tag literally.
+if IS_POSTGRES:
+    TAG_CLAUSE = "(topic_tags_arr @> ARRAY[CAST(:tag AS TEXT)])"
+else:
+    TAG_CLAUSE = "(instr(tag_list(topic_tags), ',' || :tag || ',') > 0)"
+
+    @event.listens_for(engine, "connect")
+    def _register_sqlite_functions(dbapi_conn, _record):
+        dbapi_conn.create_function("tag_list", 1, _sqlite_tag_list, deterministic=True)
+
 def init_db():
     with engine.begin() as conn:
         conn.execute(text(SCHEMA_SQL))
+        conn.execute(text(VERSION_SCHEMA_SQL))
+        conn.execute(text(SEED_VERSION_SQL))
+        if IS_POSTGRES:
+            conn.execute(text(PG_SCHEMA_SQL))
+            conn.execute(text(PG_INDEX_SQL))
+            conn.execute(text(PG_TOP_VIEW_SQL))
+
+LISTING_COLUMNS = "id, title, organizer, url, location, is_remote, topic_tags, cfp_deadline, event_date, source, last_seen"
+
+# Render-ready columns for the HTML table, in the order home.html unpacks them.
+# Aliases must differ from the source column names so ORDER BY still sorts on
+# the real cfp_deadline rather than its text rendering.
+DISPLAY_COLUMNS = """url, title,
+      COALESCE(organizer, '') AS organizer_display,
+      COALESCE(NULLIF(location, ''), CASE WHEN is_remote THEN 'Remote' ELSE '' END) AS location_display,
+      COALESCE(topic_tags, '') AS tags_display,
+      COALESCE(CAST(cfp_deadline AS TEXT), '') AS deadline_display,
+      COALESCE(CAST(event_date AS TEXT), '') AS event_date_display,
+      COALESCE(source, '') AS source_display"""
+
+def _build_listing_stmt(
+    has_q: bool,
+    has_tag: bool,
+    has_remote: bool,
+    columns: str = LISTING_COLUMNS,
+    source_table: str = "opportunities",
+):
+    where = []
+    binds = [bindparam("limit", type_=Integer)]
+    if has_q:
+        where.append(f"(title {LIKE_OP} :q OR organizer {LIKE_OP} :q)")
+        binds.append(bindparam("q", type_=String))
+    if has_tag:
+        where.append(TAG_CLAUSE)
+        binds.append(bindparam("tag", type_=String))
+    if has_remote:
+        where.append("(is_remote = :remote)")
+        binds.append(bindparam("remote", type_=Boolean))
+
+    where_clause = ("WHERE " + " AND ".join(where)) if where else ""
+    return text(f"""
+    SELECT {columns}
+    FROM {source_table}
+    {where_clause}
+    ORDER BY cfp_deadline ASC NULLS LAST, last_seen DESC
+    LIMIT :limit;
+    """).bindparams(*binds)
+
+# One prebuilt statement per column set and combination of active filters,
+# keyed by (display, has q, has tag, has remote, top view), so requests never
+# assemble SQL. The top-view variants only exist for the unfiltered listing.
+STMT_CACHE = {
+    (display, has_q, has_tag, has_remote, False): _build_listing_stmt(
+        has_q, has_tag, has_remote, columns=DISPLAY_COLUMNS if display else LISTING_COLUMNS
+    )
+    for display in (False, True)
+    for has_q in (False, True)
+    for has_tag in (False, True)
+    for has_remote in (False, True)
+}
+STMT_CACHE.update({
+    (display, False, False, False, True): _build_listing_stmt(
+        False, False, False, columns=DISPLAY_COLUMNS if display else LISTING_COLUMNS, source_table="opp_top"
+    )
+    for display in (False, True)
+})
+
+def _compile_for_asyncpg(stmt):
+    # asyncpg wants $n placeholders; keep the bind names in positional order.
+    compiled = stmt.compile(dialect=asyncpg_dialect())
+    return compiled.string, tuple(compiled.positiontup)
+
+ASYNCPG_SQL = {key: _compile_for_asyncpg(stmt) for key, stmt in STMT_CACHE.items()} if IS_POSTGRES else {}
+
+VERSION_SQL = "SELECT COALESCE(MAX(version), 0) FROM data_version WHERE id = 1"
 
-init_db()
+def _read_pool() -> Optional[asyncpg.Pool]:
+    # None on SQLite, and when the app runs without its lifespan.
+    return getattr(app.state, "read_pool", None)
 
-def fetch_opportunities(
+def _listing_query(display: bool, q: Optional[str], tag: Optional[str], remote: Optional[bool], limit: int):
+    # Tags are stored trimmed and lowercased; a blank tag means no filter.
+    tag = tag.strip().lower() if tag else ""
+    params = {"limit": limit}
+    if q:
+        params["q"] = f"%{q}%"
+    if tag:
+        params["tag"] = tag
+    if remote is not None:
+        params["remote"] = remote
+
+    mask = (bool(q), bool(tag), remote is not None)
+    top_view = IS_POSTGRES and not any(mask) and limit <= TOP_VIEW_ROWS
+    return (display, *mask, top_view), params
+
+def _execute_listing(key, params):
+    with read_engine.connect() as conn:
+        result = conn.execute(STMT_CACHE[key], params)
+        return result.all() if key[0] else result.mappings().all()
+
+async def _fetch_listing(display: bool, q: Optional[str], tag: Optional[str], remote: Optional[bool], limit: int):
+    key, params = _listing_query(display, q, tag, remote, limit)
+    pool = _read_pool()
+    if pool is None:
+        return await run_in_threadpool(_execute_listing, key, params)
+    sql, names = ASYNCPG_SQL[key]
+    async with pool.acquire() as conn:
+        return await conn.fetch(sql, *(params[n] for n in names))
+
+async def fetch_opportunities(
     q: Optional[str] = None,
     tag: Optional[str] = None,
     remote: Optional[bool] = None,
     limit: int = 50,
 ):
-    where = []
-    params = {"limit": limit}
+    return await _fetch_listing(False, q, tag, remote, limit)
 
-    if q:
-        where.append("(LOWER(title) LIKE :q OR LOWER(organizer) LIKE :q)")
-        params["q"] = f"%{q.lower()}%"
+async def fetch_display_rows(
+    q: Optional[str] = None,
+    tag: Optional[str] = None,
+    remote: Optional[bool] = None,
+    limit: int = 50,
+):
+    # Same listing as fetch_opportunities, as tuples of DISPLAY_COLUMNS with
+    # NULLs already coalesced in SQL.
+    return await _fetch_listing(True, q, tag, remote, limit)
 
-    if tag:
-        where.append("(LOWER(topic_tags) LIKE :tag)")
-        params["tag"] = f"%{tag.lower()}%"
+def _data_version_sync() -> int:
+    with read_engine.connect() as conn:
+        return conn.execute(text(VERSION_SQL)).scalar_one()
 
-    if remote is not None:
-        where.append("(is_remote = :remote)")
-        params["remote"] = remote
+async def data_version() -> int:
+    # opportunities only changes when scrape.py runs, and every run bumps this.
+    pool = _read_pool()
+    if pool is None:
+        return await run_in_threadpool(_data_version_sync)
+    return await pool.fetchval(VERSION_SQL)
 
-    where_clause = ("WHERE " + " AND ".join(where)) if where else ""
-    sql = f"""
-    SELECT id, title, organizer, url, location, is_remote, topic_tags, cfp_deadline, event_date, source, last_seen
-    FROM opportunities
-    {where_clause}
-    ORDER BY
-      CASE WHEN cfp_deadline IS NULL THEN 1 ELSE 0 END,
-      cfp_deadline ASC,
-      last_seen DESC
-    LIMIT :limit;
-    """
+def _build_id() -> str:
+    # Changes with the response code and markup, so a deploy invalidates the
+    # ETags the previous build handed out even when the data hasn't changed.
+    digest = hashlib.blake2b(os.getenv("RENDER_GIT_COMMIT", "").encode(), digest_size=8)
+    template_dir = os.path.join(os.path.dirname(__file__), "templates")
+    paths = [__file__] + sorted(os.path.join(template_dir, name) for name in os.listdir(template_dir))
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+BUILD_ID = _build_id()
+
+def opportunities_etag(version: int, *key) -> str:
+    raw = ":".join(str(k) for k in (BUILD_ID, version, *key))
+    # Weak, because GZipMiddleware may serve the same content with a different encoding.
+    return 'W/"' + hashlib.blake2b(raw.encode(), digest_size=8).hexdigest() + '"'
+
+CACHE_HEADERS = {"Cache-Control": "public, max-age=60"}
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    # "*" matches any current representation; otherwise compare weakly,
+    # ignoring W/ prefixes on either side.
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    if "*" in tags or etag[2:] in tags:
+        return Response(status_code=304, headers={"ETag": etag, **CACHE_HEADERS})
+    return None
+
+class RowsJSONResponse(ORJSONResponse):
+    # orjson handles dates natively; asyncpg Records and RowMappings aren't
+    # dict subclasses, so they go through default= and get converted only at
+    # encode time.
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=dict)
+
+# Upper bound for ?limit=; also keeps it inside the INTEGER bind parameter.
+MAX_API_LIMIT = 10000
 
+# Larger result sets are streamed in chunks so the client starts receiving
+# bytes before the whole list has been encoded.
+STREAM_MIN_ROWS = 1000
+STREAM_CHUNK_ROWS = 500
+
+def _stream_rows_json(results):
+    yield b'{"count":%d,"results":[' % len(results)
+    for i in range(0, len(results), STREAM_CHUNK_ROWS):
+        chunk = orjson.dumps(results[i:i + STREAM_CHUNK_ROWS], default=dict)[1:-1]
+        yield (b"," + chunk) if i else chunk
+    yield b"]}"
+
+templates = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    autoescape=select_autoescape(["html"]),
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+# Rendered home pages by (data version, q, tag, remote), as (etag, html).
+# Keying on the version means a scrape invalidates every worker's entries on
+# their next request; a hit costs only the data_version lookup. The TTL just
+# evicts entries for versions that are no longer current. Only the async
+# home() touches it, on the event loop thread, so it needs no lock.
+_home_cache = TTLCache(maxsize=256, ttl=60)
+
+@app.post("/internal/refresh")
+def internal_refresh(x_refresh_token: Optional[str] = Header(default=None)):
+    # Called by the scraper cron; only enabled when REFRESH_TOKEN is configured.
+    token = os.getenv("REFRESH_TOKEN")
+    if not token or x_refresh_token != token:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    # Bump the version with the refresh so every worker's ETags and cached
+    # pages move on to whatever the view now holds.
     with engine.begin() as conn:
-        rows = conn.execute(text(sql), params).mappings().all()
-    return [dict(r) for r in rows]
+        if IS_POSTGRES:
+            conn.execute(text(REFRESH_TOP_VIEW_SQL))
+        conn.execute(text(BUMP_VERSION_SQL))
+    return {"refreshed": IS_POSTGRES}
 
 @app.get("/", response_class=HTMLResponse)
-def home(
+async def home(
+    request: Request,
     q: Optional[str] = Query(default=None),
     tag: Optional[str] = Query(default=None),
     remote: Optional[str] = Query(default=None),  # "yes" / "no" / None
@@ -97,94 +416,41 @@ def home(
     elif remote == "no":
         remote_bool = False
 
-    results = fetch_opportunities(q=q, tag=tag, remote=remote_bool, limit=50)
-
-    def esc(s: Optional[str]) -> str:
-        return (s or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-    rows_html = ""
-    for r in results:
-        deadline = r["cfp_deadline"] or ""
-        edate = r["event_date"] or ""
-        tags = r["topic_tags"] or ""
-        loc = r["location"] or ("Remote" if r["is_remote"] else "")
-        rows_html += f"""
-        <tr>
-          <td><a href="{esc(r["url"])}" target="_blank" rel="noreferrer">{esc(r["title"])}</a></td>
-          <td>{esc(r.get("organizer") or "")}</td>
-          <td>{esc(loc)}</td>
-          <td>{esc(tags)}</td>
-          <td>{deadline}</td>
-          <td>{edate}</td>
-          <td>{esc(r.get("source") or "")}</td>
-        </tr>
-        """
-
-    html = f"""
-    <!doctype html>
-    <html>
-      <head>
-        <meta charset="utf-8"/>
-        <meta name="viewport" content="width=device-width, initial-scale=1"/>
-        <title>Speaking Opportunity Finder</title>
-        <style>
-          body {{ font-family: -apple-system, system-ui, Segoe UI, Roboto, Arial; margin: 24px; }}
-          .card {{ border: 1px solid #ddd; border-radius: 12px; padding: 16px; max-width: 1100px; }}
-          .row {{ display: flex; gap: 12px; flex-wrap: wrap; }}
-          input, select {{ padding: 10px; border-radius: 10px; border: 1px solid #ccc; min-width: 220px; }}
-          button {{ padding: 10px 14px; border-radius: 10px; border: 1px solid #333; background: #111; color: #fff; cursor: pointer; }}
-          table {{ width: 100%; border-collapse: collapse; margin-top: 14px; }}
-          th, td {{ text-align: left; padding: 10px; border-bottom: 1px solid #eee; vertical-align: top; }}
-          th {{ font-size: 12px; text-transform: uppercase; letter-spacing: .04em; color: #555; }}
-          .hint {{ color: #666; font-size: 13px; margin-top: 8px; }}
-        </style>
-      </head>
-      <body>
-        <h1>Speaking Opportunity Finder</h1>
-        <div class="card">
-          <form method="get">
-            <div class="row">
-              <input name="q" placeholder="Search (title or organizer)" value="{esc(q)}"/>
-              <input name="tag" placeholder="Tag (e.g., AI, sustainability)" value="{esc(tag)}"/>
-              <select name="remote">
-                <option value="" {"selected" if remote is None else ""}>Remote or in-person (any)</option>
-                <option value="yes" {"selected" if remote == "yes" else ""}>Remote only</option>
-                <option value="no" {"selected" if remote == "no" else ""}>In-person only</option>
-              </select>
-              <button type="submit">Search</button>
-            </div>
-          </form>
-          <div class="hint">
-            This is a starter prototype. Next we’ll plug in real sources and refresh on a schedule.
-          </div>
-          <table>
-            <thead>
-              <tr>
-                <th>Opportunity</th>
-                <th>Organizer</th>
-                <th>Location</th>
-                <th>Tags</th>
-                <th>CFP deadline</th>
-                <th>Event date</th>
-                <th>Source</th>
-              </tr>
-            </thead>
-            <tbody>
-              {rows_html if rows_html else "<tr><td colspan='7'>No results yet. (We’ll add sample data in the next step.)</td></tr>"}
-            </tbody>
-          </table>
-        </div>
-      </body>
-    </html>
-    """
-    return HTMLResponse(html)
+    version = await data_version()
+    cache_key = (version, q or "", tag or "", remote)
+    cached = _home_cache.get(cache_key)
+
+    if cached is not None:
+        etag, html = cached
+    else:
+        etag = opportunities_etag(version, "html", *cache_key[1:])
+
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    if cached is None:
+        rows = await fetch_display_rows(q=q, tag=tag, remote=remote_bool, limit=50)
+        html = templates.get_template("home.html").render(rows=rows, q=q, tag=tag, remote=remote)
+        _home_cache[cache_key] = (etag, html)
+
+    return HTMLResponse(html, headers={"ETag": etag, **CACHE_HEADERS})
 
 @app.get("/api/opportunities")
-def api_opportunities(
+async def api_opportunities(
+    request: Request,
     q: Optional[str] = None,
     tag: Optional[str] = None,
     remote: Optional[bool] = None,
-    limit: int = 50,
+    limit: int = Query(default=50, ge=0, le=MAX_API_LIMIT),
 ):
-    results = fetch_opportunities(q=q, tag=tag, remote=remote, limit=limit)
-    return JSONResponse({"count": len(results), "results": results})
+    etag = opportunities_etag(await data_version(), "json", q, tag, remote, limit)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    results = await fetch_opportunities(q=q, tag=tag, remote=remote, limit=limit)
+    headers = {"ETag": etag, **CACHE_HEADERS}
+    if len(results) >= STREAM_MIN_ROWS:
+        return StreamingResponse(_stream_rows_json(results), media_type="application/json", headers=headers)
+    return RowsJSONResponse({"count": len(results), "results": results}, headers=headers)
@@ -1,3 +1,4 @@
+import argparse
 import os
 from datetime import date
 from sqlalchemy import create_engine, text
@@ -7,8 +8,10 @@ def _normalize_database_url(url: str) -> str:
         return url.replace("postgres://", "postgresql://", 1)
     return url
 
-DB_URL = os.getenv("DATABASE_URL", "sqlite:///./opportunities.db")
-engine = create_engine(_normalize_database_url(DB_URL), pool_pre_ping=True)
+DB_URL = _normalize_database_url(os.getenv("DATABASE_URL", "sqlite:///./opportunities.db"))
+# psycopg2 sends executemany() batches as pipelined pages instead of one round-trip per row.
+engine_kwargs = {"executemany_mode": "values_plus_batch"} if DB_URL.startswith("postgresql") else {}
+engine = create_engine(DB_URL, pool_pre_ping=True, **engine_kwargs)
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS opportunities (
@@ -41,7 +44,33 @@ ON CONFLICT (url) DO UPDATE SET
   last_seen = EXCLUDED.last_seen;
 """
 
-def main():
+UPSERT_STMT = text(UPSERT_SQL)
+
+# Single-row counter bumped in the same transaction as the upserts; the web
+# app derives its ETags from it.
+VERSION_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS data_version (
+  id INTEGER PRIMARY KEY CHECK (id = 1),
+  version BIGINT NOT NULL
+);
+"""
+
+BUMP_VERSION_SQL = """
+INSERT INTO data_version (id, version) VALUES (1, 1)
+ON CONFLICT (id) DO UPDATE SET version = data_version.version + 1;
+"""
+
+# Refreshes the web app's default-listing view; skipped until the app has created it.
+REFRESH_TOP_VIEW_SQL = """
+DO $$
+BEGIN
+  IF to_regclass('opp_top') IS NOT NULL THEN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY opp_top;
+  END IF;
+END $$;
+"""
+
+def main(init: bool = False):
     today = date.today()
 
     sample = [
@@ -84,11 +113,17 @@ def main():
     ]
 
     with engine.begin() as conn:
-        conn.execute(text(SCHEMA_SQL))
-        for item in sample:
-            conn.execute(text(UPSERT_SQL), item)
+        if init:
+            conn.execute(text(SCHEMA_SQL))
+            conn.execute(text(VERSION_SCHEMA_SQL))
+        conn.execute(UPSERT_STMT, sample)
+        conn.execute(text(BUMP_VERSION_SQL))
+        if engine.dialect.name == "postgresql":
+            conn.execute(text(REFRESH_TOP_VIEW_SQL))
 
     print(f"Inserted/updated {len(sample)} items.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--init", action="store_true", help="create the opportunities and data_version tables if they are missing")
+    main(init=parser.parse_args().init)